@@ -2,9 +2,11 @@ using System;
 using System.IO;
 using System.Text;
 using System.Xml;
+using System.IO.Pipes;
 using System.Runtime.InteropServices;
 using System.Collections.Generic;
 using System.Threading;
+using System.Web.Script.Serialization;
 
 namespace EZCADBridge
 {
@@ -47,10 +49,57 @@ namespace EZCADBridge
         [DllImport("MarkEzd.dll")]
         private static extern int lmc1_WritePort(int nPort, int nValue);
 
+        // Whether lmc1_Initial has succeeded in this process
+        static bool initialized = false;
+
+        // Outcome of the command being executed, reported as {"ok", "code", "data"}
+        static bool resultOk;
+        static string resultCode;
+        static object resultData;
+
+        static void ResetResult()
+        {
+            resultOk = false;
+            resultCode = "no_result";
+            resultData = null;
+        }
+
+        static void Succeed(string code, object data = null)
+        {
+            resultOk = true;
+            resultCode = code;
+            resultData = data;
+        }
+
+        static void Fail(string code, string message, object data = null)
+        {
+            Console.WriteLine($"ERROR: {message}");
+            resultOk = false;
+            resultCode = code;
+            resultData = data;
+        }
+
+        static Dictionary<string, object> ResultToDictionary()
+        {
+            return new Dictionary<string, object>
+            {
+                { "ok", resultOk },
+                { "code", resultCode },
+                { "data", resultData }
+            };
+        }
+
         static void Main(string[] args)
         {
             try
             {
+                if (args.Length > 0 && args[0] == "--serve")
+                {
+                    // Persistent mode: stdout is reserved for the response protocol
+                    RunServer(args);
+                    return;
+                }
+
                 // Print startup information
                 Console.WriteLine("EZCAD Bridge Application Starting...");
                 Console.WriteLine("Current Directory: " + Directory.GetCurrentDirectory());
@@ -61,53 +110,19 @@ namespace EZCADBridge
                     return;
                 }
 
-                string command = args[0].ToLower();
-                
-                switch (command)
+                ResetResult();
+                try
                 {
-                    case "info":
-                        ShowInfo();
-                        break;
-                    
-                    case "open":
-                        if (args.Length < 2)
-                        {
-                            Console.WriteLine("ERROR: Missing EZD file path. Usage: EZCADBridge open <ezd_file_path>");
-                            return;
-                        }
-                        OpenEzdFile(args[1]);
-                        break;
-                    
-                    case "mark":
-                        HandleMarkCommand(args);
-                        break;
-                    
-                    case "update":
-                        HandleUpdateCommand(args);
-                        break;
-                    
-                    case "list":
-                        ListEntities();
-                        break;
-                    
-                    case "red":
-                        HandleRedCommand(args);
-                        break;
-
-                    case "save":
-                        if (args.Length < 2)
-                        {
-                            Console.WriteLine("ERROR: Missing output file path. Usage: EZCADBridge save <output_file_path>");
-                            return;
-                        }
-                        SaveEzdFile(args[1]);
-                        break;
-
-                    default:
-                        Console.WriteLine($"ERROR: Unknown command '{command}'");
-                        ShowHelp();
-                        break;
+                    Dispatch(args);
                 }
+                catch (Exception ex)
+                {
+                    Fail("exception", ex.Message);
+                    Console.WriteLine($"Stack Trace: {ex.StackTrace}");
+                }
+                
+                // Machine-readable outcome for scripts driving the command line
+                Console.WriteLine("RESULT " + new JavaScriptSerializer().Serialize(ResultToDictionary()));
             }
             catch (Exception ex)
             {
@@ -121,6 +136,186 @@ namespace EZCADBridge
             }
         }
 
+        static void Dispatch(string[] args)
+        {
+            string command = args[0].ToLower();
+            
+            switch (command)
+            {
+                case "info":
+                    ShowInfo();
+                    break;
+                
+                case "open":
+                    if (args.Length < 2)
+                    {
+                        Fail("missing_argument", "Missing EZD file path. Usage: EZCADBridge open <ezd_file_path>");
+                        return;
+                    }
+                    OpenEzdFile(args[1]);
+                    break;
+                
+                case "mark":
+                    HandleMarkCommand(args);
+                    break;
+                
+                case "update":
+                    HandleUpdateCommand(args);
+                    break;
+                
+                case "list":
+                    ListEntities();
+                    break;
+                
+                case "red":
+                    HandleRedCommand(args);
+                    break;
+
+                case "save":
+                    if (args.Length < 2)
+                    {
+                        Fail("missing_argument", "Missing output file path. Usage: EZCADBridge save <output_file_path>");
+                        return;
+                    }
+                    SaveEzdFile(args[1]);
+                    break;
+
+                default:
+                    Fail("unknown_command", $"Unknown command '{command}'");
+                    ShowHelp();
+                    break;
+            }
+        }
+
+        static void RunServer(string[] args)
+        {
+            // Request/response protocol, one JSON message per request:
+            //   request:  {"cmd": "update", "args": ["TextObject1", "Serial: 12345"]}
+            //   request:  {"cmd": "mark_batch", "entities": {"TextObject1": "Serial: 12345"}}
+            //   response: {"ok": true, "code": "updated", "data": null, "output": "..."}
+            // Messages travel as length-prefixed frames (uint32 little-endian
+            // byte count, then UTF-8 JSON) over stdin/stdout or, with
+            // "--pipe <name>", over a named pipe. The process keeps
+            // MarkEzd.dll initialized between requests and exits on
+            // {"cmd": "quit"} or when the client disconnects.
+            UTF8Encoding utf8 = new UTF8Encoding(false);
+            
+            // Anything written outside a request goes to stderr so it can never
+            // be mistaken for a response
+            TextWriter stray = new StreamWriter(Console.OpenStandardError(), utf8) { AutoFlush = true };
+            Console.SetOut(stray);
+            
+            if (args.Length > 2 && args[1] == "--pipe")
+            {
+                ServePipe(args[2], utf8, stray);
+            }
+            else
+            {
+                ServeStdio(utf8, stray);
+            }
+        }
+
+        static void ServeStdio(UTF8Encoding utf8, TextWriter stray)
+        {
+            ServeFrames(Console.OpenStandardInput(), Console.OpenStandardOutput(), utf8, stray);
+        }
+
+        static void ServePipe(string pipeName, UTF8Encoding utf8, TextWriter stray)
+        {
+            using (NamedPipeServerStream pipe = new NamedPipeServerStream(
+                pipeName, PipeDirection.InOut, 1, PipeTransmissionMode.Byte))
+            {
+                pipe.WaitForConnection();
+                ServeFrames(pipe, pipe, utf8, stray);
+            }
+        }
+
+        static void ServeFrames(Stream input, Stream output, UTF8Encoding utf8, TextWriter stray)
+        {
+            BinaryReader reader = new BinaryReader(input, utf8);
+            BinaryWriter writer = new BinaryWriter(output, utf8);
+            
+            while (true)
+            {
+                int length;
+                try
+                {
+                    length = reader.ReadInt32();
+                }
+                catch (EndOfStreamException)
+                {
+                    break;
+                }
+                
+                string request = utf8.GetString(reader.ReadBytes(length));
+                
+                bool quit;
+                byte[] response = utf8.GetBytes(HandleRequest(request, stray, out quit));
+                writer.Write(response.Length);
+                writer.Write(response);
+                writer.Flush();
+                
+                if (quit)
+                {
+                    break;
+                }
+            }
+        }
+
+        static string HandleRequest(string json, TextWriter stray, out bool quit)
+        {
+            JavaScriptSerializer serializer = new JavaScriptSerializer();
+            StringWriter captured = new StringWriter();
+            quit = false;
+            
+            // Reuse the command line handlers by capturing their console output
+            Console.SetOut(captured);
+            ResetResult();
+            try
+            {
+                Dictionary<string, object> request = serializer.Deserialize<Dictionary<string, object>>(json);
+                List<string> args = new List<string> { Convert.ToString(request["cmd"]) };
+                
+                object requestArgs;
+                if (request.TryGetValue("args", out requestArgs) && requestArgs is System.Collections.IEnumerable)
+                {
+                    foreach (object arg in (System.Collections.IEnumerable)requestArgs)
+                    {
+                        args.Add(Convert.ToString(arg));
+                    }
+                }
+                
+                string command = args[0].ToLower();
+                if (command == "quit")
+                {
+                    quit = true;
+                    Succeed("quit");
+                }
+                else if (command == "update_batch" || command == "mark_batch")
+                {
+                    object entities;
+                    request.TryGetValue("entities", out entities);
+                    HandleBatchCommand(command, entities as Dictionary<string, object> ?? new Dictionary<string, object>());
+                }
+                else
+                {
+                    Dispatch(args.ToArray());
+                }
+            }
+            catch (Exception ex)
+            {
+                Fail("exception", ex.Message);
+            }
+            finally
+            {
+                Console.SetOut(stray);
+            }
+            
+            Dictionary<string, object> response = ResultToDictionary();
+            response["output"] = captured.ToString();
+            return serializer.Serialize(response);
+        }
+
         static void ShowHelp()
         {
             Console.WriteLine("EZCADBridge - Bridge application for EZCAD2 and MarkEzd.dll");
@@ -134,6 +329,8 @@ namespace EZCADBridge
             Console.WriteLine("  EZCADBridge list                          - List all entities in current file");
             Console.WriteLine("  EZCADBridge red <x> <y>                   - Position red light pointer");
             Console.WriteLine("  EZCADBridge save <output_file_path>       - Save current document to file");
+            Console.WriteLine("  EZCADBridge --serve                       - Serve JSON commands over stdin/stdout");
+            Console.WriteLine("  EZCADBridge --serve --pipe <name>         - Serve JSON commands over a named pipe");
             Console.WriteLine();
             Console.WriteLine("Examples:");
             Console.WriteLine("  EZCADBridge open template.ezd");
@@ -193,31 +390,45 @@ namespace EZCADBridge
                     }
                 }
             }
+            
+            Succeed("info", new Dictionary<string, object> { { "markezd_dll_found", File.Exists(dllPath) } });
         }
 
         static void OpenEzdFile(string filePath)
         {
             if (!File.Exists(filePath))
             {
-                Console.WriteLine($"ERROR: File not found - {filePath}");
+                Fail("file_not_found", $"File not found - {filePath}");
                 return;
             }
             
             Console.WriteLine($"Opening EZD file: {filePath}");
+            
+            // In server mode the library stays initialized between requests
+            if (initialized)
+            {
+                lmc1_Close();
+                initialized = false;
+            }
+            
             int result = lmc1_Initial(filePath, 0); // 0 = open existing file
             
             if (result != 0)
             {
-                Console.WriteLine($"ERROR: Failed to open file. Error code: {result}");
+                Fail("open_failed", $"Failed to open file. Error code: {result}");
                 return;
             }
             
+            initialized = true;
+            
             Console.WriteLine("File opened successfully.");
             
             // Display entity count
             int entityCount = 0;
             lmc1_GetEntityCount(ref entityCount);
             Console.WriteLine($"Entity count: {entityCount}");
+            
+            Succeed("opened", new Dictionary<string, object> { { "entity_count", entityCount } });
         }
 
         static void HandleMarkCommand(string[] args)
@@ -231,11 +442,12 @@ namespace EZCADBridge
                 
                 if (result != 0)
                 {
-                    Console.WriteLine($"ERROR: Failed to mark entity. Error code: {result}");
+                    Fail("mark_failed", $"Failed to mark entity. Error code: {result}");
                     return;
                 }
                 
                 Console.WriteLine("Entity marking completed.");
+                Succeed("marked");
             }
             else
             {
@@ -245,11 +457,12 @@ namespace EZCADBridge
                 
                 if (result != 0)
                 {
-                    Console.WriteLine($"ERROR: Failed to execute marking. Error code: {result}");
+                    Fail("mark_failed", $"Failed to execute marking. Error code: {result}");
                     return;
                 }
                 
                 Console.WriteLine("Marking completed.");
+                Succeed("marked");
             }
         }
 
@@ -257,7 +470,7 @@ namespace EZCADBridge
         {
             if (args.Length < 3)
             {
-                Console.WriteLine("ERROR: Missing parameters. Usage: EZCADBridge update <entity_name> <text>");
+                Fail("missing_argument", "Missing parameters. Usage: EZCADBridge update <entity_name> <text>");
                 return;
             }
             
@@ -275,6 +488,14 @@ namespace EZCADBridge
                 newText = textBuilder.ToString();
             }
             
+            if (UpdateEntityText(entityName, newText))
+            {
+                Succeed("updated");
+            }
+        }
+
+        static bool UpdateEntityText(string entityName, string newText)
+        {
             Console.WriteLine($"Updating entity: {entityName}");
             Console.WriteLine($"New text: {newText}");
             
@@ -283,8 +504,8 @@ namespace EZCADBridge
             
             if (result != 0)
             {
-                Console.WriteLine($"ERROR: Entity not found or error getting entity type. Error code: {result}");
-                return;
+                Fail("entity_not_found", $"Entity not found or error getting entity type. Error code: {result}");
+                return false;
             }
             
             Console.WriteLine($"Entity type: {entityType}");
@@ -293,11 +514,44 @@ namespace EZCADBridge
             
             if (result != 0)
             {
-                Console.WriteLine($"ERROR: Failed to update entity text. Error code: {result}");
-                return;
+                Fail("update_failed", $"Failed to update entity text. Error code: {result}");
+                return false;
             }
             
             Console.WriteLine("Entity updated successfully.");
+            return true;
+        }
+
+        static void HandleBatchCommand(string command, Dictionary<string, object> entities)
+        {
+            // update_batch: set every entity in one request
+            // mark_batch:   same, then mark if all updates succeeded
+            List<string> failed = new List<string>();
+            foreach (KeyValuePair<string, object> entity in entities)
+            {
+                if (!UpdateEntityText(entity.Key, Convert.ToString(entity.Value)))
+                {
+                    failed.Add(entity.Key);
+                }
+            }
+            
+            if (failed.Count > 0)
+            {
+                Fail("update_failed", $"Failed to update {failed.Count} of {entities.Count} entities.",
+                     new Dictionary<string, object> { { "failed_entities", failed } });
+                return;
+            }
+            
+            Console.WriteLine($"All {entities.Count} entities updated successfully.");
+            
+            if (command == "mark_batch")
+            {
+                HandleMarkCommand(new string[] { "mark" });
+            }
+            else
+            {
+                Succeed("updated");
+            }
         }
 
         static void ListEntities()
@@ -307,7 +561,7 @@ namespace EZCADBridge
             
             if (result != 0)
             {
-                Console.WriteLine($"ERROR: Failed to get entity count. Error code: {result}");
+                Fail("list_failed", $"Failed to get entity count. Error code: {result}");
                 return;
             }
             
@@ -316,12 +570,14 @@ namespace EZCADBridge
             if (entityCount == 0)
             {
                 Console.WriteLine("No entities found. Make sure an EZD file is opened first.");
+                Succeed("listed", new List<string>());
                 return;
             }
             
             Console.WriteLine("Entities:");
             Console.WriteLine("----------");
             
+            List<string> names = new List<string>();
             for (int i = 0; i < entityCount; i++)
             {
                 StringBuilder nameBuilder = new StringBuilder(256);
@@ -338,20 +594,23 @@ namespace EZCADBridge
                 lmc1_GetEntityType(entityName, ref entityType);
                 
                 Console.WriteLine($"  [{i}] {entityName} (Type: {entityType})");
+                names.Add(entityName);
             }
+            
+            Succeed("listed", names);
         }
 
         static void HandleRedCommand(string[] args)
         {
             if (args.Length < 3)
             {
-                Console.WriteLine("ERROR: Missing parameters. Usage: EZCADBridge red <x> <y>");
+                Fail("missing_argument", "Missing parameters. Usage: EZCADBridge red <x> <y>");
                 return;
             }
             
             if (!double.TryParse(args[1], out double x) || !double.TryParse(args[2], out double y))
             {
-                Console.WriteLine("ERROR: Invalid coordinates. X and Y must be valid numbers.");
+                Fail("invalid_argument", "Invalid coordinates. X and Y must be valid numbers.");
                 return;
             }
             
@@ -360,11 +619,12 @@ namespace EZCADBridge
             
             if (!result)
             {
-                Console.WriteLine("ERROR: Failed to position red light pointer.");
+                Fail("red_light_failed", "Failed to position red light pointer.");
                 return;
             }
             
             Console.WriteLine("Red light positioned successfully.");
+            Succeed("red_light_positioned");
         }
 
         static void SaveEzdFile(string outputPath)
@@ -374,11 +634,12 @@ namespace EZCADBridge
             
             if (result != 0)
             {
-                Console.WriteLine($"ERROR: Failed to save file. Error code: {result}");
+                Fail("save_failed", $"Failed to save file. Error code: {result}");
                 return;
             }
             
             Console.WriteLine("File saved successfully.");
+            Succeed("saved");
         }
     }
 }
\ No newline at end of file
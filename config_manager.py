@@ -45,6 +45,7 @@ class ConfigManager:
             "auto_trigger": "false",
             "batch_process": "false",
             "max_concurrent_processes": "1",
+            "bridge_pool_size": "1",
             "file_pattern_excel": "*.xls;*.xlsx",
             "file_pattern_ezd": "*.ezd",
             "update_excel_status": "true",
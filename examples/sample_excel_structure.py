@@ -3,23 +3,51 @@ This script generates a sample Excel file for demonstrating the EZCAD2 Automatio
 It creates a file with common fields used in laser marking applications.
 """
 
+import numpy as np
 import pandas as pd
 import os
 
-def create_sample_excel():
+def write_excel(df, excel_path, sheet_name="Sheet1"):
+    """
+    Write a DataFrame to an .xlsx file
+    
+    Uses xlsxwriter in constant_memory mode, which flushes each row to disk as
+    soon as it is written, and falls back to openpyxl if xlsxwriter is missing.
+    Rows are written one at a time because constant_memory mode only supports
+    row-by-row output (DataFrame.to_excel writes column by column).
+    """
+    try:
+        import xlsxwriter
+    except ImportError:
+        df.to_excel(excel_path, sheet_name=sheet_name, index=False, engine='openpyxl')
+        return
+    
+    workbook = xlsxwriter.Workbook(excel_path, {
+        "constant_memory": True,
+        "default_date_format": "yyyy-mm-dd",
+    })
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, [str(col) for col in df.columns])
+    for row_idx, values in enumerate(df.itertuples(index=False, name=None), start=1):
+        worksheet.write_row(row_idx, 0, values)
+    workbook.close()
+
+def create_sample_excel(num_rows=10):
     """Create a sample Excel file for demonstration"""
     
-    # Create sample data
+    # Create sample data, one vectorized operation per column
+    ids = pd.Series(np.arange(1, num_rows + 1))
+    suffix = ids.astype(str)
     data = {
-        "ID": list(range(1, 11)),
-        "SerialNumber": ["SN" + str(100000 + i) for i in range(1, 11)],
-        "PartNumber": ["PN-A1234" for _ in range(10)],
-        "Date": ["2025-05-10" for _ in range(10)],
-        "Text1": ["Sample Text 1-" + str(i) for i in range(1, 11)],
-        "Text2": ["Sample Text 2-" + str(i) for i in range(1, 11)],
-        "QRCode": ["https://example.com/product/" + str(i) for i in range(1, 11)],
-        "Processed": [False for _ in range(10)],
-        "Processed_Time": ["" for _ in range(10)]
+        "ID": ids,
+        "SerialNumber": "SN" + (100000 + ids).astype(str),
+        "PartNumber": np.full(num_rows, "PN-A1234"),
+        "Date": pd.date_range("2025-05-10", periods=num_rows, freq="D").strftime("%Y-%m-%d"),
+        "Text1": "Sample Text 1-" + suffix,
+        "Text2": "Sample Text 2-" + suffix,
+        "QRCode": "https://example.com/product/" + suffix,
+        "Processed": np.zeros(num_rows, dtype=bool),
+        "Processed_Time": np.full(num_rows, ""),
     }
     
     # Create DataFrame
@@ -29,9 +57,9 @@ def create_sample_excel():
     if not os.path.exists("examples"):
         os.makedirs("examples")
     
-    # Save to Excel with UTF-8 encoding
+    # Save to Excel, streaming rows with xlsxwriter when it is available
     excel_path = "examples/sample_data.xlsx"
-    df.to_excel(excel_path, index=False, engine='openpyxl')
+    write_excel(df, excel_path)
     
     print(f"Sample Excel file created at: {excel_path}")
     
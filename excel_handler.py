@@ -1,19 +1,39 @@
-import pandas as pd
+import io
 import os
+import shutil
 import logging
+import hashlib
+import importlib.util
 from datetime import datetime
 
 class ExcelHandler:
     """Handle Excel file operations including reading, validation, and data extraction"""
     
-    def __init__(self, logger=None):
-        """Initialize with optional logger"""
+    # Oldest cached DataFrames are evicted once the cache grows past this size
+    CACHE_MAX_BYTES = 512 * 1024 * 1024
+    
+    # Part of every cache key; change it whenever parsing changes the DataFrame it yields
+    CACHE_FORMAT = b"object-cells-v2"
+    
+    def __init__(self, logger=None, cache_dir=None):
+        """
+        Initialize with optional logger
+        
+        Args:
+            logger: Logger instance
+            cache_dir: Directory for Parquet copies of parsed workbooks, keyed by
+                       file content; None disables the cache
+        """
         self.logger = logger or logging.getLogger('EZCADAutomation')
+        self.cache_dir = cache_dir
         self.current_file = None
         self.current_data = None
     
     def load_excel(self, file_path):
         """Load an Excel file and return the DataFrame"""
+        # pandas is heavy to import and only needed on this path
+        import pandas as pd
+        
         try:
             self.logger.info(f"Loading Excel file: {file_path}")
             
@@ -22,11 +42,32 @@ class ExcelHandler:
                 self.logger.error(f"Excel file not found: {file_path}")
                 return None
             
-            # Use appropriate engine based on file extension
-            engine = 'xlrd' if file_path.lower().endswith('.xls') else None
+            # Read the file once; the bytes serve both the cache key and the parser
+            with open(file_path, 'rb') as f:
+                data = f.read()
             
-            # Load the file
-            df = pd.read_excel(file_path, engine=engine)
+            # Reuse the parsed data if this exact file content was loaded before
+            cache_path = self._cache_path(data) if self.cache_dir else None
+            df = self._read_cache(cache_path) if cache_path else None
+            
+            if df is None:
+                # Parse with the appropriate engine based on file extension
+                if file_path.lower().endswith('.xls'):
+                    engine = 'xlrd'
+                else:
+                    # calamine parses in Rust, several times faster than openpyxl
+                    engine = 'calamine'
+                    if importlib.util.find_spec('python_calamine') is None:
+                        self.logger.debug("python-calamine not installed, falling back to openpyxl")
+                        engine = 'openpyxl'
+                
+                # Parse cells as stored, then infer the column dtypes; pandas' own
+                # inference would turn boolean columns with blanks into 1.0/0.0
+                with pd.ExcelFile(io.BytesIO(data), engine=engine) as workbook:
+                    df = workbook.parse(0, dtype=object).infer_objects()
+                
+                if cache_path:
+                    self._write_cache(df, cache_path)
             
             self.current_file = file_path
             self.current_data = df
@@ -40,6 +81,120 @@ class ExcelHandler:
             self.logger.error(f"Failed to load Excel file {file_path}: {str(e)}")
             return None
     
+    def _cache_path(self, data):
+        """Return the cache file for the given workbook content"""
+        hasher = hashlib.sha1(self.CACHE_FORMAT)
+        hasher.update(data)
+        digest = hasher.hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{digest}.parquet")
+    
+    def _read_cache(self, cache_path):
+        """Read a cached DataFrame, or return None on a miss"""
+        import pandas as pd
+        
+        if not os.path.exists(cache_path):
+            return None
+        
+        try:
+            df = pd.read_parquet(cache_path)
+        except Exception as e:
+            self.logger.debug(f"Ignoring unreadable Excel cache {cache_path}: {str(e)}")
+            return None
+        
+        # Mark as recently used so eviction removes older entries first
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        
+        self.logger.debug(f"Loaded Excel data from cache: {cache_path}")
+        return df
+    
+    def _write_cache(self, df, cache_path):
+        """Store a parsed DataFrame in the cache; caching is skipped without pyarrow"""
+        temp_path = cache_path + '.tmp'
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            df.to_parquet(temp_path, compression='zstd')
+            os.replace(temp_path, cache_path)
+        except ImportError:
+            self.logger.debug("pyarrow not installed, Excel cache disabled")
+            return
+        except Exception as e:
+            # e.g. mixed-type columns that Parquet cannot store
+            self.logger.debug(f"Could not cache Excel data: {str(e)}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+        
+        self._evict_cache()
+    
+    def _evict_cache(self):
+        """Delete the oldest cache files while the cache exceeds CACHE_MAX_BYTES"""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith('.parquet'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.CACHE_MAX_BYTES:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+    
+    def iter_rows_streaming(self, file_path):
+        """
+        Stream the rows of an .xlsx file without building a DataFrame
+        
+        Uses openpyxl's read-only mode, so memory use does not grow with the
+        number of rows. The workbook is closed once the rows are exhausted.
+        Like pd.read_excel, empty rows between data rows are kept and trailing
+        empty rows are dropped, so row positions match the DataFrame index.
+        
+        Returns:
+            tuple: (header, rows) with the column names of the first sheet and an
+                   iterator of row value tuples, or (None, None) on failure
+        """
+        try:
+            from openpyxl import load_workbook
+            
+            self.logger.info(f"Streaming Excel file: {file_path}")
+            
+            workbook = load_workbook(file_path, read_only=True, data_only=True)
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            first_row = next(rows, ())
+            width = len(first_row)
+            header = [
+                name if name is not None else f"Unnamed: {index}"
+                for index, name in enumerate(first_row)
+            ]
+        except Exception as e:
+            self.logger.error(f"Failed to stream Excel file {file_path}: {str(e)}")
+            return None, None
+        
+        def generate():
+            try:
+                blank_rows = 0
+                for row in rows:
+                    if all(value is None for value in row):
+                        # Only emitted if more data follows
+                        blank_rows += 1
+                        continue
+                    for _ in range(blank_rows):
+                        yield (None,) * width
+                    blank_rows = 0
+                    # Pad short rows so every row lines up with the header
+                    yield row + (None,) * (width - len(row)) if len(row) < width else row
+            finally:
+                workbook.close()
+        
+        return header, generate()
+    
     def get_preview(self, max_rows=5, max_cols=10):
         """Get a string preview of the current DataFrame"""
         if self.current_data is None:
@@ -110,15 +265,140 @@ class ExcelHandler:
         self.logger.info(f"Split data into {len(batches)} batches")
         return batches
     
-    def save_processed_status(self, processed_rows, status_col='Processed', timestamp_col='Processed_Time'):
-        """Save processing status back to the Excel file"""
-        if self.current_data is None or self.current_file is None:
+    def save_processed_status(self, processed_rows, status_col='Processed', timestamp_col='Processed_Time', file_path=None):
+        """
+        Save processing status back to the Excel file
+        
+        .xlsx files are rewritten in streaming mode straight from the file on
+        disk, so no DataFrame is required and memory use stays flat. .xlsm
+        files are updated in place so their VBA project is kept. Other
+        formats are rewritten from the loaded DataFrame.
+        
+        Args:
+            processed_rows: Indices of the processed data rows (0 = first row below the header)
+            status_col: Name of the status column, added if missing
+            timestamp_col: Name of the timestamp column, added if missing
+            file_path: Excel file to update, defaults to the loaded file
+        """
+        file_path = file_path or self.current_file
+        if file_path is None:
             self.logger.error("No Excel file loaded for saving status")
             return False
         
+        base, ext = os.path.splitext(file_path)
+        if ext.lower() not in ('.xlsx', '.xlsm'):
+            return self._save_processed_status_dataframe(file_path, processed_rows, status_col, timestamp_col)
+        
+        try:
+            # Create backup of original file, keeping its extension so a .xlsm backup still opens
+            backup_file = f"{base}_backup_{datetime.now().strftime('%Y%m%d%H%M%S')}{ext}"
+            shutil.copy2(file_path, backup_file)
+            self.logger.info(f"Created backup of Excel file: {backup_file}")
+            
+            if ext.lower() == '.xlsm':
+                self._update_status_columns_keep_vba(file_path, processed_rows, status_col, timestamp_col)
+            else:
+                self._rewrite_status_columns(file_path, processed_rows, status_col, timestamp_col)
+            self.logger.info(f"Updated processing status in Excel file: {file_path}")
+            
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to save processing status: {str(e)}")
+            return False
+    
+    def _rewrite_status_columns(self, file_path, processed_rows, status_col, timestamp_col):
+        """Stream the workbook into a write-only copy with updated status columns"""
+        from openpyxl import Workbook, load_workbook
+        
+        processed = set(processed_rows)
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        source = load_workbook(file_path, read_only=True)
+        temp_file = os.path.join(os.path.dirname(os.path.abspath(file_path)),
+                                 f"~{os.path.basename(file_path)}.tmp")
+        try:
+            target = Workbook(write_only=True)
+            
+            for sheet_index, sheet in enumerate(source.worksheets):
+                out = target.create_sheet(sheet.title)
+                rows = sheet.iter_rows(values_only=True)
+                
+                if sheet_index > 0:
+                    # Only the first sheet holds the data; copy the rest as-is
+                    for row in rows:
+                        out.append(row)
+                    continue
+                
+                # Add status columns if they don't exist
+                header = list(next(rows, ()))
+                for col in (status_col, timestamp_col):
+                    if col not in header:
+                        header.append(col)
+                status_idx = header.index(status_col)
+                timestamp_idx = header.index(timestamp_col)
+                out.append(header)
+                
+                # Update status for processed rows
+                for row_idx, row in enumerate(rows):
+                    row = list(row) + [None] * (len(header) - len(row))
+                    if row_idx in processed:
+                        row[status_idx] = 'Processed'
+                        row[timestamp_idx] = timestamp
+                    out.append(row)
+            
+            target.save(temp_file)
+        finally:
+            source.close()
+        
+        # Swap the new file in only once it has been written completely
+        os.replace(temp_file, file_path)
+    
+    def _update_status_columns_keep_vba(self, file_path, processed_rows, status_col, timestamp_col):
+        """Update the status columns of a macro-enabled workbook, keeping its VBA project
+        
+        A write-only workbook cannot carry the VBA project, so this loads the
+        whole workbook instead of streaming it.
+        """
+        from openpyxl import load_workbook
+        
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        workbook = load_workbook(file_path, keep_vba=True)
+        sheet = workbook.worksheets[0]
+        data_rows = sheet.max_row - 1
+        
+        # Add status columns if they don't exist
+        header = [cell.value for cell in sheet[1]]
+        for col in (status_col, timestamp_col):
+            if col not in header:
+                header.append(col)
+                sheet.cell(row=1, column=len(header), value=col)
+        status_idx = header.index(status_col) + 1
+        timestamp_idx = header.index(timestamp_col) + 1
+        
+        # Update status for processed rows
+        for row_idx in processed_rows:
+            if 0 <= row_idx < data_rows:
+                sheet.cell(row=row_idx + 2, column=status_idx, value='Processed')
+                sheet.cell(row=row_idx + 2, column=timestamp_idx, value=timestamp)
+        
+        temp_file = os.path.join(os.path.dirname(os.path.abspath(file_path)),
+                                 f"~{os.path.basename(file_path)}.tmp")
+        workbook.save(temp_file)
+        
+        # Swap the new file in only once it has been written completely
+        os.replace(temp_file, file_path)
+    
+    def _save_processed_status_dataframe(self, file_path, processed_rows, status_col, timestamp_col):
+        """Save processing status by rewriting the file's DataFrame, loading it if needed"""
+        if self.current_data is None or self.current_file != file_path:
+            if self.load_excel(file_path) is None:
+                return False
+        
         try:
             # Create backup of original file
-            backup_file = f"{os.path.splitext(self.current_file)[0]}_backup_{datetime.now().strftime('%Y%m%d%H%M%S')}.xlsx"
+            backup_file = f"{os.path.splitext(file_path)[0]}_backup_{datetime.now().strftime('%Y%m%d%H%M%S')}.xlsx"
             self.current_data.to_excel(backup_file, index=False)
             self.logger.info(f"Created backup of Excel file: {backup_file}")
             
@@ -136,8 +416,8 @@ class ExcelHandler:
                     self.current_data.at[row_idx, timestamp_col] = timestamp
             
             # Save updated file
-            self.current_data.to_excel(self.current_file, index=False)
-            self.logger.info(f"Updated processing status in Excel file: {self.current_file}")
+            self.current_data.to_excel(file_path, index=False)
+            self.logger.info(f"Updated processing status in Excel file: {file_path}")
             
             return True
             
@@ -12,18 +12,113 @@ triggering laser marking operations.
 
 import os
 import sys
+import json
 import subprocess
 import logging
-import tempfile
-import shutil
+import struct
+import threading
 import time
+import itertools
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import ctypes
 
+# Frame header for the bridge transports: payload length as uint32 little-endian
+_FRAME_HEADER = struct.Struct("<I")
+
+# Distinguishes the pipes of several bridges started by the same Python process
+_pipe_counter = itertools.count(1)
+
+# Commands that do not depend on a template opened earlier in the session
+_SESSION_FREE_COMMANDS = frozenset({"info", "open"})
+
+# A bridge built before server mode existed exits at once on --serve
+_NO_SERVE_ERROR = ("Bridge exited without serving any request. Builds of EZCADBridge.exe "
+                   "from before --serve support are too old, rebuild it "
+                   "(see examples/build_csharp_bridge.md)")
+
+
+class _FramedTransport:
+    """Length-prefixed JSON frames over a pair of binary streams"""
+    
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+    
+    def request(self, message):
+        """Send one request frame and return the response payload"""
+        self._send(message)
+        
+        (length,) = _FRAME_HEADER.unpack(self._read_exact(_FRAME_HEADER.size))
+        return self._read_exact(length).decode("utf-8", "replace")
+    
+    def send_quit(self):
+        """Ask the bridge to quit without waiting for its response"""
+        self._send(json.dumps({"cmd": "quit"}))
+    
+    def close(self):
+        """Close our end of the streams"""
+        for stream in (self._writer, self._reader):
+            try:
+                stream.close()
+            except OSError:
+                pass
+    
+    def _send(self, message):
+        payload = message.encode("utf-8")
+        self._write_all(_FRAME_HEADER.pack(len(payload)) + payload)
+        self._writer.flush()
+    
+    def _write_all(self, data):
+        view = memoryview(data)
+        while view:
+            written = self._writer.write(view)
+            view = view[written:]
+    
+    def _read_exact(self, size):
+        buffer = bytearray()
+        while len(buffer) < size:
+            chunk = self._reader.read(size - len(buffer))
+            if not chunk:
+                raise ConnectionError("Bridge closed its output")
+            buffer += chunk
+        return bytes(buffer)
+
+
+class _StdioTransport(_FramedTransport):
+    """Frames over the bridge process's stdin/stdout"""
+    
+    def __init__(self, proc):
+        super().__init__(proc.stdout, proc.stdin)
+
+
+class _NamedPipeTransport(_FramedTransport):
+    """Frames over a Windows named pipe"""
+    
+    def __init__(self, pipe_name, proc, timeout=10.0):
+        path = rf"\\.\pipe\{pipe_name}"
+        deadline = time.monotonic() + timeout
+        
+        # The bridge creates the pipe shortly after starting, so retry until it exists
+        while True:
+            try:
+                pipe = open(path, "r+b", buffering=0)
+                break
+            except OSError:
+                if proc.poll() is not None:
+                    raise ConnectionError(f"Bridge process exited with code {proc.returncode} before opening {path}")
+                if time.monotonic() > deadline:
+                    raise ConnectionError(f"Timed out waiting for bridge pipe {path}")
+                time.sleep(0.05)
+                
+        super().__init__(pipe, pipe)
+
+
 class EZCADBridge:
     """Bridge for communicating with EZCAD2 via C# bridge application"""
     
-    def __init__(self, bridge_exe_path=None, logger=None):
+    def __init__(self, bridge_exe_path=None, logger=None, pool_size=1):
         """
         Initialize the EZCAD Bridge
         
@@ -31,44 +126,45 @@ class EZCADBridge:
             bridge_exe_path: Path to the EZCADBridge.exe application
                               If None, it will be searched in standard locations
             logger: Logger instance, if None a new one will be created
+            pool_size: Number of bridge processes process_data may drive
+                       concurrently (e.g. one per marking head)
         """
         self.logger = logger or logging.getLogger('EZCADAutomation.Bridge')
         
         # Find bridge executable
-        if bridge_exe_path is None:
+        if not bridge_exe_path:
             # Default locations to look for the bridge executable
-            current_dir = os.path.dirname(os.path.abspath(__file__))
+            base_dir = Path(__file__).resolve().parent
             possible_locations = [
-                os.path.join(current_dir, "EZCADIntegration", "bin", "Release", "EZCADBridge.exe"),
-                os.path.join(current_dir, "EZCADIntegration", "bin", "Debug", "EZCADBridge.exe"),
-                os.path.join(current_dir, "EZCADBridge.exe"),
+                base_dir / "EZCADIntegration" / "bin" / "Release" / "EZCADBridge.exe",
+                base_dir / "EZCADIntegration" / "bin" / "Debug" / "EZCADBridge.exe",
+                base_dir / "EZCADBridge.exe",
             ]
             
-            for location in possible_locations:
-                if os.path.exists(location):
-                    bridge_exe_path = location
-                    break
+            # Stop at the first hit; a found location needs no further check
+            bridge_exe_path = next((location for location in possible_locations if location.is_file()), None)
                     
             if bridge_exe_path is None:
                 self.logger.error("EZCADBridge.exe not found in standard locations")
                 raise FileNotFoundError("EZCADBridge.exe not found. Please build the C# bridge application or specify the path.")
+        else:
+            bridge_exe_path = Path(bridge_exe_path)
+            
+            # Check if EZCAD bridge exists
+            if not bridge_exe_path.is_file():
+                self.logger.error(f"Bridge executable not found at: {bridge_exe_path}")
+                raise FileNotFoundError(f"Bridge executable not found at: {bridge_exe_path}")
         
         self.bridge_exe_path = bridge_exe_path
         self.logger.info(f"Using bridge executable at: {self.bridge_exe_path}")
         
-        # Check if EZCAD bridge exists
-        if not os.path.exists(self.bridge_exe_path):
-            self.logger.error(f"Bridge executable not found at: {self.bridge_exe_path}")
-            raise FileNotFoundError(f"Bridge executable not found at: {self.bridge_exe_path}")
-        
         # Verify bridge directory has the required DLL
-        bridge_dir = os.path.dirname(self.bridge_exe_path)
-        dll_path = os.path.join(bridge_dir, "MarkEzd.dll")
+        dll_path = self.bridge_exe_path.parent / "MarkEzd.dll"
         
-        if os.path.exists(dll_path):
+        if dll_path.is_file():
             try:
                 # DLL dosyasını yükle
-                ctypes.CDLL(dll_path)  # DLL'i yükler
+                ctypes.CDLL(str(dll_path))  # DLL'i yükler
                 self.logger.info(f"Successfully loaded {dll_path}")
             except Exception as e:
                 self.logger.error(f"Error loading DLL: {str(e)}")
@@ -77,6 +173,70 @@ class EZCADBridge:
         
         # Current ezd file
         self.current_ezd_file = None
+        
+        # Entity texts known to be set in the current file, to skip redundant updates
+        self._last_values = {}
+        
+        # Persistent bridge process, started on the first command
+        self._proc = None
+        self._transport = None
+        self._proc_lock = threading.Lock()
+        
+        # Held across multi-request sequences (open, list, mark...) that depend on
+        # the open template; _proc_lock only covers a single request
+        self.session_lock = threading.RLock()
+        
+        # Extra bridges for concurrent processing, created on demand
+        self.pool_size = max(1, int(pool_size))
+        self._workers = []
+        self._stats_lock = threading.Lock()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """
+        Shut down the persistent bridge process
+        
+        Sends a quit command so the bridge can release MarkEzd.dll cleanly,
+        and kills the process if it does not exit within 5 seconds. Worker bridges
+        used for concurrent processing are closed as well. Waits for a
+        process_data batch in progress to finish first.
+        """
+        with self.session_lock:
+            self._close()
+    
+    def _close(self):
+        """Run close with the session lock held"""
+        for worker in self._workers:
+            worker.close()
+        self._workers = []
+        
+        with self._proc_lock:
+            proc, self._proc = self._proc, None
+            transport, self._transport = self._transport, None
+            self.current_ezd_file = None
+            
+            if proc is None:
+                return
+            
+            try:
+                if proc.poll() is None:
+                    # A wedged bridge never answers, so only wait (bounded) for it to exit
+                    transport.send_quit()
+                    proc.wait(timeout=5)
+            except (OSError, ValueError, subprocess.TimeoutExpired) as e:
+                self.logger.warning(f"Bridge process did not exit cleanly: {str(e)}")
+                proc.kill()
+                proc.wait()
+            finally:
+                if transport is not None:
+                    transport.close()
+            
+            self.logger.info("Bridge process stopped")
     
     def get_bridge_info(self):
         """
@@ -104,8 +264,9 @@ class EZCADBridge:
             
         self.logger.info(f"Opening EZD file: {ezd_file_path}")
         result = self._run_bridge_command(["open", ezd_file_path])
+        self._last_values = {}
         
-        if "successfully" in result.get("output", "").lower():
+        if result["ok"]:
             self.current_ezd_file = ezd_file_path
             return True
         return False
@@ -127,10 +288,68 @@ class EZCADBridge:
             
         self.logger.info(f"Updating entity '{entity_name}' with text: {new_text}")
         result = self._run_bridge_command(["update", entity_name, new_text])
+        self._remember_values({entity_name: new_text}, result["ok"])
         
-        if "updated successfully" in result.get("output", "").lower():
-            return True
-        return False
+        return result["ok"]
+    
+    def update_batch(self, updates):
+        """
+        Update several entities in the current EZD file with a single bridge request
+        
+        Entities that already hold the requested text are not sent again.
+        
+        Args:
+            updates: Dict mapping entity names to new text
+            
+        Returns:
+            bool: Success state
+        """
+        if self.current_ezd_file is None:
+            self.logger.error("No EZD file currently open")
+            return False
+            
+        updates = self._changed_values(updates)
+        self.logger.info(f"Updating {len(updates)} entities: {updates}")
+        result = self._run_bridge_command(["update_batch"], entities=updates)
+        self._remember_values(updates, result["ok"])
+        
+        return result["ok"]
+    
+    def mark_with_updates(self, updates):
+        """
+        Update several entities and execute marking with a single bridge request
+        
+        Entities that already hold the requested text are not sent again.
+        
+        Args:
+            updates: Dict mapping entity names to new text
+            
+        Returns:
+            bool: Success state
+        """
+        if self.current_ezd_file is None:
+            self.logger.error("No EZD file currently open")
+            return False
+            
+        updates = self._changed_values(updates)
+        self.logger.info(f"Updating {len(updates)} entities and marking: {updates}")
+        result = self._run_bridge_command(["mark_batch"], entities=updates)
+        self._remember_values(updates, result["ok"] or result["code"] == "mark_failed")
+        
+        return result["ok"]
+    
+    def _changed_values(self, updates):
+        """Drop the updates whose entity already holds the requested text"""
+        return {name: text for name, text in updates.items() if self._last_values.get(name) != text}
+    
+    def _remember_values(self, updates, applied):
+        """Track entity texts known to be set in the open template"""
+        if applied:
+            self._last_values.update(updates)
+        else:
+            # A failed request may have applied some of the updates
+            for name in updates:
+                self._last_values.pop(name, None)
     
     def mark(self, entity_name=None):
         """
@@ -155,9 +374,7 @@ class EZCADBridge:
             
         result = self._run_bridge_command(command)
         
-        if "completed" in result.get("output", "").lower():
-            return True
-        return False
+        return result["ok"]
     
     def red_light(self, x, y):
         """
@@ -177,38 +394,32 @@ class EZCADBridge:
         self.logger.info(f"Positioning red light at ({x}, {y})")
         result = self._run_bridge_command(["red", str(x), str(y)])
         
-        if "positioned successfully" in result.get("output", "").lower():
-            return True
-        return False
+        return result["ok"]
     
-    def list_entities(self):
+    def list_entities(self, raise_on_error=False):
         """
         List all entities in the current EZD file
         
+        Args:
+            raise_on_error: Raise RuntimeError instead of returning an empty
+                            list when the entities cannot be listed
+        
         Returns:
             list: List of entity names or empty list if none or error
         """
         if self.current_ezd_file is None:
             self.logger.error("No EZD file currently open")
+            if raise_on_error:
+                raise RuntimeError("No EZD file currently open")
             return []
             
         self.logger.info("Listing entities in current EZD file")
         result = self._run_bridge_command(["list"])
-        
-        entities = []
-        for line in result.get("output", "").splitlines():
-            line = line.strip()
-            if line.startswith("[") and "]" in line:
-                # Extract entity name
-                parts = line.split("]", 1)
-                if len(parts) > 1:
-                    entity_info = parts[1].strip()
-                    name_parts = entity_info.split("(Type:", 1)
-                    if name_parts:
-                        entity_name = name_parts[0].strip()
-                        entities.append(entity_name)
-                    
-        return entities
+        if not result["ok"]:
+            if raise_on_error:
+                raise RuntimeError(f"Failed to list entities: {result['error'] or result['code']}")
+            return []
+        return list(result["data"] or [])
     
     def save_ezd_file(self, output_path):
         """
@@ -227,9 +438,7 @@ class EZCADBridge:
         self.logger.info(f"Saving EZD file to: {output_path}")
         result = self._run_bridge_command(["save", output_path])
         
-        if "saved successfully" in result.get("output", "").lower():
-            return True
-        return False
+        return result["ok"]
     
     def process_data(self, ezd_template, data_items, output_path=None):
         """
@@ -247,6 +456,14 @@ class EZCADBridge:
             self.logger.error(f"Template file not found: {ezd_template}")
             return {"success": False, "error": "Template file not found"}
             
+        # Keep other callers from opening another template mid-batch
+        with self.session_lock:
+            return self._process_data(ezd_template, data_items, output_path)
+    
+    def _process_data(self, ezd_template, data_items, output_path):
+        """Run process_data with the session lock held"""
+        # Wall-clock timestamps are for reporting; the duration uses a monotonic clock
+        started = time.perf_counter()
         stats = {
             "total": len(data_items),
             "success": 0,
@@ -259,99 +476,214 @@ class EZCADBridge:
             return {"success": False, "error": "Failed to open template file"}
             
         # Get available entities
-        available_entities = self.list_entities()
-        self.logger.info(f"Available entities in template: {available_entities}")
+        entity_names = self.list_entities()
+        self.logger.info(f"Available entities in template: {entity_names}")
+        available_entities = frozenset(entity_names)
+        
+        # Every item has the same keys, so resolve the entities to update once
+        update_keys = tuple(key for key in data_items[0] if key != "id") if data_items else ()
+        effective_keys = tuple(key for key in update_keys if key in available_entities)
+        for key in update_keys:
+            if key not in available_entities:
+                self.logger.warning(f"Entity not found in template: {key}")
+        
+        # Fail fast if the data cannot update anything in this template
+        if data_items and not effective_keys:
+            self.logger.error("None of the data fields match an entity in the template")
+            return {"success": False, "error": "No overlapping entities between data and template"}
             
         # Process each data item
-        for i, data_item in enumerate(data_items):
-            try:
-                item_id = data_item.get("id", f"Item {i+1}")
-                self.logger.info(f"Processing item {i+1}/{len(data_items)}: {item_id}")
-                
-                # Update each entity
-                update_success = True
-                for entity_name, text_value in data_item.items():
-                    if entity_name != "id":  # Skip the id field
-                        if entity_name in available_entities:
-                            if not self.update_text(entity_name, str(text_value)):
-                                self.logger.error(f"Failed to update entity: {entity_name}")
-                                update_success = False
-                        else:
-                            self.logger.warning(f"Entity not found in template: {entity_name}")
-                
-                if update_success:
-                    # Execute marking
-                    if self.mark():
-                        stats["success"] += 1
-                    else:
-                        self.logger.error(f"Failed to mark item: {item_id}")
-                        stats["errors"] += 1
-                else:
-                    stats["errors"] += 1
-                    
-            except Exception as e:
-                self.logger.error(f"Error processing item {i+1}: {str(e)}")
-                stats["errors"] += 1
+        if self.pool_size == 1 or len(data_items) < 2:
+            for i, data_item in enumerate(data_items):
+                self._process_item(self, i, data_item, effective_keys, stats)
+        else:
+            pool = self._open_pool(ezd_template)
+            
+            def run(i, data_item):
+                bridge = pool.get()
+                try:
+                    self._process_item(bridge, i, data_item, effective_keys, stats)
+                finally:
+                    pool.put(bridge)
+            
+            with ThreadPoolExecutor(max_workers=pool.qsize()) as executor:
+                list(executor.map(run, range(len(data_items)), data_items))
         
         # Save the final file if requested
         if output_path:
             self.save_ezd_file(output_path)
             
+        stats["duration"] = time.perf_counter() - started
         stats["end_time"] = time.time()
-        stats["duration"] = stats["end_time"] - stats["start_time"]
         
         return stats
     
-    def _run_bridge_command(self, args):
+    def _process_item(self, bridge, index, data_item, entity_keys, stats):
         """
-        Run a command through the bridge application
+        Update and mark a single data item on the given bridge
+        
+        Args:
+            bridge: EZCADBridge with the template open
+            index: Position of the item in the batch
+            data_item: Dict of entity names to text values, plus an optional id
+            entity_keys: Keys of data_item to send, all present in the template
+            stats: Statistics dict to update (guarded by the stats lock)
+        """
+        try:
+            item_id = data_item.get("id", f"Item {index+1}")
+            self.logger.info(f"Processing item {index+1}/{stats['total']}: {item_id}")
+            
+            updates = {key: str(data_item[key]) for key in entity_keys}
+            
+            # Update all entities and mark in one round trip
+            success = bridge.mark_with_updates(updates)
+            if not success:
+                self.logger.error(f"Failed to update or mark item: {item_id}")
+                
+        except Exception as e:
+            self.logger.error(f"Error processing item {index+1}: {str(e)}")
+            success = False
+        
+        with self._stats_lock:
+            stats["success" if success else "errors"] += 1
+    
+    def _open_pool(self, ezd_template):
+        """
+        Prepare the bridges used for concurrent processing
+        
+        This bridge (already holding the template) plus up to pool_size - 1
+        worker bridges, each a separate bridge process with the template open.
+        Workers are kept between batches and stopped by close().
+        
+        Args:
+            ezd_template: Path to the EZD template file
+            
+        Returns:
+            queue.Queue: Bridges ready to process items
+        """
+        while len(self._workers) < self.pool_size - 1:
+            self._workers.append(EZCADBridge(self.bridge_exe_path, self.logger))
+        
+        pool = queue.Queue()
+        pool.put(self)
+        for worker in self._workers:
+            if worker.open_ezd_file(ezd_template):
+                pool.put(worker)
+            else:
+                self.logger.warning("Worker bridge failed to open the template, continuing without it")
+        
+        self.logger.info(f"Processing with {pool.qsize()} bridge processes")
+        return pool
+    
+    def _start_bridge_process(self):
+        """Launch the bridge in server mode (caller must hold the process lock)"""
+        if self._proc is not None:
+            # The previous process died, so its open template is gone too
+            self.logger.warning(f"Bridge process exited with code {self._proc.returncode}, restarting")
+            self.current_ezd_file = None
+            self._last_values = {}
+        
+        self.logger.info("Starting persistent bridge process")
+        if sys.platform == "win32":
+            # Named pipe: framed messages, no console buffering in the way
+            pipe_name = f"ezcadbridge-{os.getpid()}-{next(_pipe_counter)}"
+            self._proc = subprocess.Popen(
+                [self.bridge_exe_path, "--serve", "--pipe", pipe_name],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
+            )
+        else:
+            # Binary pipes: frames are decoded once per payload, not per chunk
+            self._proc = subprocess.Popen(
+                [self.bridge_exe_path, "--serve"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+        
+        # Drain stderr continuously so a chatty bridge can never block on a full pipe
+        threading.Thread(target=self._log_bridge_errors, args=(self._proc.stderr,), daemon=True).start()
+        
+        if sys.platform == "win32":
+            try:
+                self._transport = _NamedPipeTransport(pipe_name, self._proc)
+            except ConnectionError as e:
+                exited = self._proc.poll() is not None
+                self._proc.kill()
+                if exited:
+                    raise ConnectionError(_NO_SERVE_ERROR) from e
+                raise
+        else:
+            self._transport = _StdioTransport(self._proc)
+    
+    def _log_bridge_errors(self, stream):
+        """Forward the bridge's stderr to the log"""
+        for line in stream:
+            line = line.decode("utf-8", "replace").rstrip()
+            if line:
+                self.logger.error(f"Bridge error: {line}")
+    
+    def _run_bridge_command(self, args, **fields):
+        """
+        Run a command through the persistent bridge process
         
         Args:
             args: List of command arguments
+            **fields: Extra request fields, e.g. entities for batch commands
             
         Returns:
-            dict: Command result with output and return code
+            dict: Structured result: ok flag, result code, command data,
+                  captured console output and transport error (if any)
         """
-        command = [self.bridge_exe_path] + args
-        self.logger.debug(f"Running bridge command: {' '.join(command)}")
+        request = json.dumps({"cmd": args[0], "args": [str(arg) for arg in args[1:]], **fields})
+        self.logger.debug(f"Running bridge command: {' '.join(str(arg) for arg in args)}")
         
         try:
-            # Run the command with UTF-8 encoding to avoid character encoding issues
-            process = subprocess.Popen(
-                command, 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE,
-                universal_newlines=True,
-                encoding='utf-8',
-                errors='replace'  # Replace invalid characters instead of crashing
-            )
+            with self._proc_lock:
+                started = False
+                if self._proc is None or self._proc.poll() is not None:
+                    restarted = self._proc is not None
+                    self._start_bridge_process()
+                    started = True
+                    
+                    # The request was built against the template the old process had open
+                    if restarted and args[0] not in _SESSION_FREE_COMMANDS:
+                        raise ConnectionError("Bridge process restarted, the open template was lost")
+                
+                try:
+                    response = json.loads(self._transport.request(request))
+                except (OSError, ValueError) as e:
+                    # The stream is out of sync; start over with a fresh process next time
+                    self._proc.kill()
+                    if started and isinstance(e, OSError):
+                        raise ConnectionError(_NO_SERVE_ERROR) from e
+                    raise
             
-            # Capture output
-            stdout, stderr = process.communicate()
+            stdout = response.get("output", "")
             
             # Log the output
             if stdout:
                 self.logger.debug(f"Bridge output: {stdout}")
-            if stderr:
-                self.logger.error(f"Bridge error: {stderr}")
                 
             return {
+                "ok": response.get("ok") is True,
+                "code": response.get("code", ""),
+                "data": response.get("data"),
                 "output": stdout,
-                "error": stderr,
-                "return_code": process.returncode,
-                "success": process.returncode == 0
+                "error": ""
             }
             
         except Exception as e:
             self.logger.error(f"Error running bridge command: {str(e)}")
             return {
+                "ok": False,
+                "code": "transport_error",
+                "data": None,
                 "output": "",
-                "error": str(e),
-                "return_code": -1,
-                "success": False
+                "error": str(e)
             }
 
-
 def main():
     """Command line interface for the EZCAD Bridge"""
     import argparse
@@ -404,41 +736,40 @@ def main():
     
     # Create bridge instance
     try:
-        bridge = EZCADBridge(args.bridge, logger)
-        
-        if args.command == "info":
-            result = bridge.get_bridge_info()
-            print(result.get("output", "No information available"))
-            
-        elif args.command == "open":
-            success = bridge.open_ezd_file(args.ezd_file)
-            print(f"Open result: {'Success' if success else 'Failed'}")
-            
-        elif args.command == "update":
-            success = bridge.update_text(args.entity, args.text)
-            print(f"Update result: {'Success' if success else 'Failed'}")
-            
-        elif args.command == "mark":
-            success = bridge.mark(args.entity)
-            print(f"Mark result: {'Success' if success else 'Failed'}")
-            
-        elif args.command == "list":
-            entities = bridge.list_entities()
-            print("Entities:")
-            for entity in entities:
-                print(f"  - {entity}")
+        with EZCADBridge(args.bridge, logger) as bridge:
+            if args.command == "info":
+                result = bridge.get_bridge_info()
+                print(result.get("output", "No information available"))
+                
+            elif args.command == "open":
+                success = bridge.open_ezd_file(args.ezd_file)
+                print(f"Open result: {'Success' if success else 'Failed'}")
+                
+            elif args.command == "update":
+                success = bridge.update_text(args.entity, args.text)
+                print(f"Update result: {'Success' if success else 'Failed'}")
+                
+            elif args.command == "mark":
+                success = bridge.mark(args.entity)
+                print(f"Mark result: {'Success' if success else 'Failed'}")
+                
+            elif args.command == "list":
+                entities = bridge.list_entities()
+                print("Entities:")
+                for entity in entities:
+                    print(f"  - {entity}")
+                    
+            elif args.command == "red":
+                success = bridge.red_light(args.x, args.y)
+                print(f"Red light result: {'Success' if success else 'Failed'}")
+                
+            elif args.command == "save":
+                success = bridge.save_ezd_file(args.output)
+                print(f"Save result: {'Success' if success else 'Failed'}")
+                
+            else:
+                print("Please specify a command. Use --help for options.")
                 
-        elif args.command == "red":
-            success = bridge.red_light(args.x, args.y)
-            print(f"Red light result: {'Success' if success else 'Failed'}")
-            
-        elif args.command == "save":
-            success = bridge.save_ezd_file(args.output)
-            print(f"Save result: {'Success' if success else 'Failed'}")
-            
-        else:
-            print("Please specify a command. Use --help for options.")
-            
     except Exception as e:
         logger.error(f"Error: {str(e)}")
         sys.exit(1)
@@ -11,13 +11,37 @@ automated laser marking based on Excel data sources.
 import os
 import sys
 import logging
-import pandas as pd
+import functools
+import datetime
 import time
 from pathlib import Path
 
 from excel_handler import ExcelHandler
 from ezcad_bridge import EZCADBridge
 
+def _cell_text(value):
+    """
+    Convert one Excel cell value to the text sent to the bridge
+    
+    Shared by the DataFrame and streaming readers so a cell marks the same text
+    however the workbook was read: missing cells (None, NaN, NaT) become "",
+    whole-number floats drop their ".0" (pandas stores int columns with blanks
+    as floats) and dates without a time of day print as YYYY-MM-DD.
+    """
+    # NaN and NaT are the only values not equal to themselves
+    if value is None or value != value:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, datetime.datetime):
+        if value.time() == datetime.time(0):
+            return value.strftime("%Y-%m-%d")
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return str(value)
+
+
 class EZCADIntegration:
     """Integrates Excel data processing with EZCAD2 marking"""
     
@@ -35,6 +59,9 @@ class EZCADIntegration:
         # Initialize components
         self.excel_handler = ExcelHandler(self.logger)
         
+        # Entity lists keyed by (template path, modification time)
+        self._template_entities = functools.lru_cache(maxsize=32)(self._load_template_entities)
+        
         # Initialize bridge
         self.bridge = None
         self._init_bridge()
@@ -43,13 +70,15 @@ class EZCADIntegration:
         """Initialize the EZCAD Bridge component"""
         try:
             bridge_exe = self.config.get('Paths', 'ezcad_bridge_exe', fallback=None)
-            self.bridge = EZCADBridge(bridge_exe, self.logger)
+            # Own key, not max_concurrent_processes (job queue threads): every bridge process drives the marking board
+            pool_size = self.config.getint('Settings', 'bridge_pool_size', fallback=1)
+            self.bridge = EZCADBridge(bridge_exe, self.logger, pool_size)
             self.logger.info("EZCAD Bridge initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize EZCAD Bridge: {str(e)}")
             self.bridge = None
     
-    def process_excel_file(self, excel_file, ezd_template, output_path=None, entity_mappings=None):
+    def process_excel_file(self, excel_file, ezd_template, output_path=None, entity_mappings=None, df=None):
         """
         Process Excel data and send to EZCAD for marking
         
@@ -58,6 +87,7 @@ class EZCADIntegration:
             ezd_template: Path to EZD template file
             output_path: Optional path to save the resulting EZD file
             entity_mappings: Optional dict mapping Excel columns to EZD entity names
+            df: Optional DataFrame already loaded from excel_file; skips re-reading it
             
         Returns:
             dict: Processing statistics
@@ -74,50 +104,123 @@ class EZCADIntegration:
             self.logger.error(f"EZD template file not found: {ezd_template}")
             return {"success": False, "error": "EZD template file not found"}
             
-        # Load Excel data
-        df = self.excel_handler.load_excel(excel_file)
-        if df is None:
-            return {"success": False, "error": "Failed to load Excel file"}
-            
-        # Get column mappings
-        if entity_mappings is None:
-            # Default mapping: use column names as entity names
-            entity_mappings = {col: col for col in df.columns}
+        update_status = self.config.getboolean('Settings', 'update_excel_status', fallback=True)
+        
+        load_start = time.perf_counter()
+        if df is not None:
+            # The caller already parsed the workbook
+            if entity_mappings is None:
+                entity_mappings = {col: col for col in df.columns}
+                
+            data_items = self._data_items_from_dataframe(df, entity_mappings)
+        elif excel_file.lower().endswith(('.xlsx', '.xlsm')):
+            # Stream rows straight from the workbook; no DataFrame is needed
+            header, rows = self.excel_handler.iter_rows_streaming(excel_file)
+            if header is None:
+                return {"success": False, "error": "Failed to load Excel file"}
+                
+            if entity_mappings is None:
+                # Default mapping: use column names as entity names
+                entity_mappings = {col: col for col in header}
+                
+            data_items = self._data_items_from_rows(header, rows, entity_mappings)
+        else:
+            # Legacy .xls files are read through pandas
+            df = self.excel_handler.load_excel(excel_file)
+            if df is None:
+                return {"success": False, "error": "Failed to load Excel file"}
+                
+            # Get column mappings
+            if entity_mappings is None:
+                # Default mapping: use column names as entity names
+                entity_mappings = {col: col for col in df.columns}
+                
+            # Convert DataFrame rows to list of dictionaries
+            data_items = self._data_items_from_dataframe(df, entity_mappings)
+        excel_load_seconds = time.perf_counter() - load_start
             
         # Process batch
-        self.logger.info(f"Processing {len(df)} rows from Excel")
-        
-        # Convert DataFrame rows to list of dictionaries
-        data_items = []
-        for index, row in df.iterrows():
-            row_num = index + 1 if isinstance(index, int) else 1
-            item = {"id": str(row.get("ID", f"Row {row_num}"))}
-            for excel_col, entity_name in entity_mappings.items():
-                if excel_col in row:
-                    cell_value = row[excel_col]
-                    # Ensure the value is a string
-                    item[entity_name] = str(cell_value) if cell_value is not None else ""
-            data_items.append(item)
+        self.logger.info(f"Processing {len(data_items)} rows from Excel")
             
-        # Process data through bridge
-        start_time = time.time()
+        # Process data through bridge; it records its own timing stats
         result = self.bridge.process_data(ezd_template, data_items, output_path)
         
         # Add processing statistics
-        result["total_rows"] = len(df)
-        result["duration"] = time.time() - start_time
+        result["total_rows"] = len(data_items)
+        result["excel_load_seconds"] = excel_load_seconds
         
         # Update Excel with processing status
-        if self.config.getboolean('Settings', 'update_excel_status', fallback=True):
+        if update_status:
             try:
-                processed_rows = list(range(len(df)))  # All rows processed
-                self.excel_handler.save_processed_status(processed_rows)
+                processed_rows = list(range(len(data_items)))  # All rows processed
+                self.excel_handler.save_processed_status(processed_rows, file_path=excel_file)
                 self.logger.info(f"Updated processing status in Excel file")
             except Exception as e:
                 self.logger.error(f"Failed to update Excel status: {str(e)}")
                 
         return result
     
+    @staticmethod
+    def _data_items_from_dataframe(df, entity_mappings):
+        """
+        Convert DataFrame rows into the data items expected by the bridge
+        
+        The mapped columns are selected once and their rows read with a single
+        to_numpy().tolist() call, which is about twice as fast as itertuples
+        here; each cell is then converted with _cell_text, the same conversion
+        the streaming reader uses.
+        
+        Args:
+            df: DataFrame with the Excel data
+            entity_mappings: Dict mapping Excel columns to EZD entity names
+            
+        Returns:
+            list: Dicts with an "id" key plus one key per mapped entity
+        """
+        import numpy as np
+        
+        valid_cols = [col for col in entity_mappings if col in df.columns]
+        keys = tuple(entity_mappings[col] for col in valid_cols)
+        # Object dtype keeps the cell values as Python scalars for _cell_text
+        block = df[valid_cols].astype(object).to_numpy().tolist()
+        
+        if "ID" in df.columns:
+            ids = [_cell_text(value) for value in df["ID"].astype(object).tolist()]
+        else:
+            ids = np.char.add("Row ", np.arange(1, len(df) + 1).astype(str)).tolist()
+            
+        data_items = [None] * len(block)
+        for i, values in enumerate(block):
+            data_items[i] = {"id": ids[i], **dict(zip(keys, map(_cell_text, values)))}
+            
+        return data_items
+    
+    @staticmethod
+    def _data_items_from_rows(header, rows, entity_mappings):
+        """
+        Convert streamed worksheet rows into the data items expected by the bridge
+        
+        Args:
+            header: List of column names
+            rows: Iterable of row value tuples, in header order
+            entity_mappings: Dict mapping Excel columns to EZD entity names
+            
+        Returns:
+            list: Dicts with an "id" key plus one key per mapped entity
+        """
+        # Resolve column positions once instead of looking names up per row
+        positions = [(index, entity_mappings[col]) for index, col in enumerate(header) if col in entity_mappings]
+        id_index = header.index("ID") if "ID" in header else None
+        
+        data_items = []
+        for row_num, row in enumerate(rows, start=1):
+            item = {"id": _cell_text(row[id_index]) if id_index is not None else f"Row {row_num}"}
+            for index, entity_name in positions:
+                item[entity_name] = _cell_text(row[index])
+            data_items.append(item)
+            
+        return data_items
+    
     def list_entities_in_template(self, ezd_template):
         """
         List all entities in an EZD template file
@@ -136,14 +239,33 @@ class EZCADIntegration:
             self.logger.error(f"EZD template file not found: {ezd_template}")
             return []
             
-        # Open the template
-        if not self.bridge.open_ezd_file(ezd_template):
-            self.logger.error(f"Failed to open template: {ezd_template}")
+        # Reuse the entity list while the template file is unchanged
+        try:
+            entities = self._template_entities(ezd_template, os.path.getmtime(ezd_template))
+        except (OSError, RuntimeError) as e:
+            self.logger.error(str(e))
             return []
             
-        # Get entities
-        entities = self.bridge.list_entities()
-        return entities
+        return list(entities)
+    
+    def _load_template_entities(self, ezd_template, mtime):
+        """
+        Open a template and list its entities (cached by list_entities_in_template)
+        
+        Args:
+            ezd_template: Path to EZD template file
+            mtime: Modification time of the template, part of the cache key
+            
+        Returns:
+            tuple: Entity names
+        """
+        # Waits for a running batch instead of swapping its template
+        with self.bridge.session_lock:
+            # Raising keeps failures out of the cache
+            if not self.bridge.open_ezd_file(ezd_template):
+                raise RuntimeError(f"Failed to open template: {ezd_template}")
+                
+            return tuple(self.bridge.list_entities(raise_on_error=True))
         
     def test_integration(self, ezd_template):
         """
@@ -168,15 +290,22 @@ class EZCADIntegration:
             self.logger.error(f"EZD template file not found: {ezd_template}")
             return False
             
-        if not self.bridge.open_ezd_file(ezd_template):
-            self.logger.error(f"Failed to open template: {ezd_template}")
-            return False
-            
-        # List entities
-        entities = self.bridge.list_entities()
+        # Waits for a running batch instead of swapping its template
+        with self.bridge.session_lock:
+            if not self.bridge.open_ezd_file(ezd_template):
+                self.logger.error(f"Failed to open template: {ezd_template}")
+                return False
+                
+            # List entities
+            entities = self.bridge.list_entities()
         self.logger.info(f"Entities in template: {entities}")
         
         return True
+    
+    def close(self):
+        """Stop the bridge process(es) held by this integration"""
+        if self.bridge:
+            self.bridge.close()
 
 
 def main():
@@ -223,38 +352,42 @@ def main():
     # Create integration instance
     integration = EZCADIntegration(config, logger)
     
-    if args.command == "test":
-        success = integration.test_integration(args.template)
-        print(f"Integration test: {'Success' if success else 'Failed'}")
+    try:
+        if args.command == "test":
+            success = integration.test_integration(args.template)
+            print(f"Integration test: {'Success' if success else 'Failed'}")
         
-    elif args.command == "list":
-        entities = integration.list_entities_in_template(args.template)
-        print("Template entities:")
-        for entity in entities:
-            print(f"  - {entity}")
+        elif args.command == "list":
+            entities = integration.list_entities_in_template(args.template)
+            print("Template entities:")
+            for entity in entities:
+                print(f"  - {entity}")
             
-    elif args.command == "process":
-        # Load mappings if provided
-        mappings = None
-        if args.mappings:
-            import json
-            try:
-                with open(args.mappings, 'r') as f:
-                    mappings = json.load(f)
-            except Exception as e:
-                print(f"Error loading mappings file: {str(e)}")
-                return
+        elif args.command == "process":
+            # Load mappings if provided
+            mappings = None
+            if args.mappings:
+                import json
+                try:
+                    with open(args.mappings, 'r') as f:
+                        mappings = json.load(f)
+                except Exception as e:
+                    print(f"Error loading mappings file: {str(e)}")
+                    return
                 
-        result = integration.process_excel_file(args.excel, args.template, args.output, mappings)
-        print(f"Processing result: {'Success' if result.get('success', False) else 'Failed'}")
-        print(f"Processed {result.get('success', 0)}/{result.get('total', 0)} items")
-        print(f"Duration: {result.get('duration', 0):.2f} seconds")
+            result = integration.process_excel_file(args.excel, args.template, args.output, mappings)
+            print(f"Processing result: {'Success' if result.get('success', False) else 'Failed'}")
+            print(f"Processed {result.get('success', 0)}/{result.get('total', 0)} items")
+            print(f"Duration: {result.get('duration', 0):.2f} seconds")
         
-        if result.get('error'):
-            print(f"Error: {result['error']}")
+            if result.get('error'):
+                print(f"Error: {result['error']}")
             
-    else:
-        print("Please specify a command. Use --help for options.")
+        else:
+            print("Please specify a command. Use --help for options.")
+    finally:
+        # Stop the persistent bridge process
+        integration.close()
 
 
 if __name__ == "__main__":
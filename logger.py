@@ -3,7 +3,6 @@ import os
 from logging.handlers import RotatingFileHandler
 import tkinter as tk
 from tkinter import scrolledtext
-import threading
 import queue
 import datetime
 
@@ -13,7 +12,7 @@ class LoggerSetup:
     def __init__(self):
         """Initialize the logger"""
         self.log_dir = "logs"
-        self.log_queue = queue.Queue()
+        self.log_queue = queue.SimpleQueue()
         self._setup_log_directory()
         self._configure_logger()
         
@@ -89,33 +88,43 @@ class LogPanel:
         self.log_widget.tag_config('ERROR', foreground="red")
         self.log_widget.tag_config('CRITICAL', foreground="red", background="yellow")
         
-        # Start the queue consumer thread
+        # Poll the queue from the Tk event loop; widgets must only be touched from that thread
         self.running = True
-        self.queue_thread = threading.Thread(target=self._process_log_queue)
-        self.queue_thread.daemon = True
-        self.queue_thread.start()
+        self._poll_after_id = None
+        self._process_log_queue()
     
-    def _process_log_queue(self):
-        """Process log records from the queue and display them in the widget"""
-        while self.running:
+    def _process_log_queue(self, max_records=256):
+        """Move pending log records from the queue into the widget"""
+        batch = []
+        while len(batch) < max_records:
             try:
-                # Get a log record from the queue with a timeout
-                record = self.log_queue.get(block=True, timeout=0.2)
-                self._display_log(record)
+                batch.append(self.log_queue.get_nowait())
             except queue.Empty:
-                # If queue is empty, just continue the loop
-                continue
+                break
+        
+        if batch:
+            try:
+                self._display_logs(batch)
             except Exception as e:
-                # If any other error occurs, print it and continue
+                # If any error occurs, print it and keep polling
                 print(f"Error processing log queue: {e}")
+        
+        if self.running:
+            # Come back at once if records are still waiting
+            delay = 1 if len(batch) == max_records else 100
+            self._poll_after_id = self.log_widget.after(delay, self._process_log_queue)
     
-    def _display_log(self, record):
-        """Display a log record in the widget"""
-        msg = self.format_log_record(record)
+    def _display_logs(self, records):
+        """Display log records in the widget with a single insert"""
+        # insert takes alternating text and tag arguments
+        chunks = []
+        for record in records:
+            chunks.append(self.format_log_record(record) + '\n')
+            chunks.append(record.levelname)
         
         # Enable widget to insert text, then disable it again to make it read-only
         self.log_widget.config(state=tk.NORMAL)
-        self.log_widget.insert(tk.END, msg + '\n', record.levelname)
+        self.log_widget.insert(tk.END, *chunks)
         self.log_widget.see(tk.END)  # Scroll to end
         self.log_widget.config(state=tk.DISABLED)
     
@@ -130,5 +139,8 @@ class LogPanel:
         self.log_widget.config(state=tk.DISABLED)
     
     def stop(self):
-        """Stop the log processing thread"""
+        """Stop polling the log queue"""
         self.running = False
+        if self._poll_after_id is not None:
+            self.log_widget.after_cancel(self._poll_after_id)
+            self._poll_after_id = None
@@ -51,14 +51,11 @@ def setup_exception_logging():
 def check_requirements():
     """Check for required libraries and attempt to install if missing"""
     required_packages = ['pandas', 'watchdog', 'psutil']
-    missing_packages = []
     
-    # Check which packages are missing
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            missing_packages.append(package)
+    # Check which packages are missing without importing (and initializing) them
+    import importlib.util
+    missing_packages = [package for package in required_packages
+                        if importlib.util.find_spec(package) is None]
     
     # If there are missing packages, try to install them
     if missing_packages:
@@ -73,19 +70,23 @@ def check_requirements():
             try:
                 import subprocess
                 
-                # Create a subprocess to install the packages
+                # Install all missing packages with a single pip run
                 python_exe = sys.executable
-                subprocess.check_call([
-                    python_exe, '-m', 'pip', 'install', 
-                    '--upgrade', 'pip'
-                ])
+                print(f"Installing {', '.join(missing_packages)}...")
+                process = subprocess.Popen(
+                    [python_exe, '-m', 'pip', 'install', *missing_packages],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1
+                )
                 
-                # Install each missing package
-                for package in missing_packages:
-                    print(f"Installing {package}...")
-                    subprocess.check_call([
-                        python_exe, '-m', 'pip', 'install', package
-                    ])
+                # Echo pip's output as it arrives so the pipe never fills up
+                for line in process.stdout:
+                    print(line, end='')
+                    
+                if process.wait() != 0:
+                    raise subprocess.CalledProcessError(process.returncode, process.args)
                 
                 # Success message
                 messagebox.showinfo(
@@ -93,7 +94,8 @@ def check_requirements():
                     "Required packages have been installed.\nThe application will now continue."
                 )
                 
-                # Verify installation
+                # Verify installation; forget directory listings cached before pip ran
+                importlib.invalidate_caches()
                 failed_imports = []
                 for package in missing_packages:
                     try:
@@ -126,8 +128,19 @@ def check_requirements():
 class EZCADAutomationApp:
     """The main EZCAD Automation application"""
     
-    def __init__(self, root):
-        """Initialize the application"""
+    # File dialog filters
+    EXCEL_FILETYPES = (("Excel files", "*.xls;*.xlsx"), ("All files", "*.*"))
+    EZD_FILETYPES = (("EZD files", "*.ezd"), ("All files", "*.*"))
+    EXE_FILETYPES = (("Executable files", "*.exe"), ("All files", "*.*"))
+    
+    def __init__(self, root, use_cache=True):
+        """
+        Initialize the application
+        
+        Args:
+            root: Tk root window
+            use_cache: Cache parsed Excel files under .cache/excel
+        """
         self.root = root
         root.title("EZCAD2 Automation")
         root.geometry("900x700")
@@ -136,14 +149,37 @@ class EZCADAutomationApp:
         self.logger_setup = LoggerSetup()
         self.logger = self.logger_setup.get_logger()
         self.log_queue = self.logger_setup.get_queue()
+        self.log_dir = os.path.abspath(self.logger_setup.log_dir)
+        os.makedirs(self.log_dir, exist_ok=True)
         
         # Initialize config
         self.config = ConfigManager()
         
         # Initialize components
-        self.excel_handler = ExcelHandler(self.logger)
+        cache_dir = os.path.join(".cache", "excel") if use_cache else None
+        self.excel_handler = ExcelHandler(self.logger, cache_dir=cache_dir)
         self.integration = EZCADIntegration(self.config, self.logger)
         
+        # (listing generation, entity text) from listing threads; a None text marks
+        # the end of a listing. Only the latest generation is shown.
+        self._entity_queue = queue.Queue(maxsize=1024)
+        self._entity_generation = 0
+        self._entity_draining = False
+        
+        # Saved profile names, scanned from disk on first use
+        self._profiles_cache = None
+        
+        # DataFrame of the selected Excel file and the (path, mtime) it was read from
+        self.cached_df = None
+        self._cached_df_key = None
+        
+        # Pending debounced bridge actions (Tk after ids)
+        self._list_after_id = None
+        self._test_after_id = None
+        
+        # Set while _process_excel_thread drives the bridge
+        self._processing = False
+        
         # Setup the UI
         self._create_ui()
         
@@ -156,26 +192,41 @@ class EZCADAutomationApp:
         notebook = ttk.Notebook(self.root)
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
+        # Settings variables are used by the main tab and config handling,
+        # so they exist before the settings tab is built
+        self.update_excel_status_var = tk.BooleanVar(value=True)
+        self.auto_save_var = tk.BooleanVar(value=False)
+        self.output_dir_var = tk.StringVar()
+        self.profile_name_var = tk.StringVar()
+        
         # Create main tab
         main_tab = ttk.Frame(notebook)
         notebook.add(main_tab, text="Main")
         self._create_main_tab(main_tab)
         
-        # Create settings tab
+        # The settings tab is filled in when first selected
+        self._lazy_tabs = {}
+        
         settings_tab = ttk.Frame(notebook)
         notebook.add(settings_tab, text="Settings")
-        self._create_settings_tab(settings_tab)
+        self._lazy_tabs[str(settings_tab)] = (settings_tab, self._create_settings_tab)
         
-        # Create log tab
+        # The log tab is built right away: its panel is the only consumer of the log queue
         log_tab = ttk.Frame(notebook)
         notebook.add(log_tab, text="Logs")
         self._create_log_tab(log_tab)
         
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        
         # Status bar
         status_frame = ttk.Frame(self.root)
         status_frame.pack(fill=tk.X, padx=10, pady=5)
         
         self.status_var = tk.StringVar(value="Ready")
+        
+        # Latest status text waiting to be shown; see _set_status
+        self._pending_status = None
+        self._status_after_id = None
         status_label = ttk.Label(status_frame, textvariable=self.status_var)
         status_label.pack(side=tk.LEFT)
         
@@ -184,9 +235,19 @@ class EZCADAutomationApp:
         clock_label = ttk.Label(status_frame, textvariable=self.clock_var)
         clock_label.pack(side=tk.RIGHT)
         
-        # Start the clock update
+        # Start the clock update; the date part is only rebuilt when the day changes
+        self._clock_day = None
+        self._last_date_str = ""
+        self._clock_fmt = "%H:%M"
         self._update_clock()
     
+    def _on_tab_changed(self, event):
+        """Build a lazily created tab the first time it is selected"""
+        tab = self._lazy_tabs.pop(event.widget.select(), None)
+        if tab is not None:
+            frame, create = tab
+            create(frame)
+    
     def _create_main_tab(self, parent):
         """Create the main tab content"""
         # Files selection frame
@@ -215,9 +276,15 @@ class EZCADAutomationApp:
         preview_frame = ttk.LabelFrame(parent, text="Excel Preview")
         preview_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        self.preview_text = scrolledtext.ScrolledText(preview_frame, height=10)
-        self.preview_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        self.preview_text.config(state=tk.DISABLED)
+        # A table view: only the previewed rows are created as widget items
+        self.preview_tree = ttk.Treeview(preview_frame, show="headings", height=10)
+        preview_yscroll = ttk.Scrollbar(preview_frame, orient=tk.VERTICAL, command=self.preview_tree.yview)
+        preview_xscroll = ttk.Scrollbar(preview_frame, orient=tk.HORIZONTAL, command=self.preview_tree.xview)
+        self.preview_tree.config(yscrollcommand=preview_yscroll.set, xscrollcommand=preview_xscroll.set)
+        
+        preview_xscroll.pack(side=tk.BOTTOM, fill=tk.X, padx=5)
+        preview_yscroll.pack(side=tk.RIGHT, fill=tk.Y, pady=5)
+        self.preview_tree.pack(fill=tk.BOTH, expand=True, padx=(5, 0), pady=5)
         
         # Template info frame
         template_frame = ttk.LabelFrame(parent, text="Template Entities")
@@ -247,7 +314,6 @@ class EZCADAutomationApp:
         general_frame.pack(fill=tk.X, padx=10, pady=10)
         
         # Auto-update Excel status
-        self.update_excel_status_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(general_frame, text="Update Excel Status After Processing", 
                       variable=self.update_excel_status_var).pack(anchor="w", padx=5, pady=5)
         
@@ -256,7 +322,6 @@ class EZCADAutomationApp:
         output_frame.pack(fill=tk.X, padx=10, pady=10)
         
         # Auto-save output
-        self.auto_save_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(output_frame, text="Auto-Save Modified Templates", 
                       variable=self.auto_save_var).pack(anchor="w", padx=5, pady=5)
         
@@ -265,7 +330,6 @@ class EZCADAutomationApp:
         output_dir_frame = ttk.Frame(output_frame)
         output_dir_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        self.output_dir_var = tk.StringVar()
         ttk.Entry(output_dir_frame, textvariable=self.output_dir_var, width=60).pack(side=tk.LEFT, padx=5)
         ttk.Button(output_dir_frame, text="Browse", 
                  command=self._select_output_dir).pack(side=tk.LEFT, padx=5)
@@ -280,7 +344,6 @@ class EZCADAutomationApp:
         
         ttk.Label(profile_controls, text="Profile Name:").pack(side=tk.LEFT, padx=5)
         
-        self.profile_name_var = tk.StringVar()
         ttk.Entry(profile_controls, textvariable=self.profile_name_var, width=20).pack(side=tk.LEFT, padx=5)
         
         ttk.Button(profile_controls, text="Save Profile", 
@@ -314,10 +377,41 @@ class EZCADAutomationApp:
         ttk.Button(controls_frame, text="Open Log Directory", 
                  command=self._open_log_directory).pack(side=tk.LEFT, padx=5)
     
+    def _set_status(self, text):
+        """
+        Show text in the status bar
+        
+        Updates are coalesced: the bar is refreshed at most once per 50 ms with
+        the latest text. Safe to call from worker threads.
+        """
+        self._pending_status = text
+        if self._status_after_id is None:
+            self._status_after_id = self.root.after(50, self._flush_status)
+    
+    def _flush_status(self):
+        """Apply the latest pending status text"""
+        self._status_after_id = None
+        self.status_var.set(self._pending_status)
+    
     def _update_clock(self):
-        """Update the clock in the status bar"""
-        self.clock_var.set(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-        self.root.after(1000, self._update_clock)
+        """Update the clock in the status bar at the start of every minute"""
+        if self.root.state() in ('withdrawn', 'iconic'):
+            # Nobody can see the clock; check again shortly
+            self.root.after(5000, self._update_clock)
+            return
+        
+        # time.localtime avoids building a datetime object on every tick
+        timestamp = time.time()
+        now = time.localtime(timestamp)
+        if now[:3] != self._clock_day:
+            self._clock_day = now[:3]
+            self._last_date_str = time.strftime("%Y-%m-%d", now)
+            
+        self.clock_var.set(f"{self._last_date_str} {time.strftime(self._clock_fmt, now)}")
+        
+        # Fire again right after the minute rolls over
+        delay_ms = int((60 - now.tm_sec - timestamp % 1) * 1000)
+        self.root.after(max(delay_ms, 1), self._update_clock)
     
     def _refresh_from_config(self):
         """Refresh UI elements from the config"""
@@ -364,8 +458,11 @@ class EZCADAutomationApp:
     
     def _select_excel(self):
         """Browse for Excel file"""
-        file_types = [("Excel files", "*.xls;*.xlsx"), ("All files", "*.*")]
-        file_path = filedialog.askopenfilename(title="Select Excel File", filetypes=file_types)
+        file_path = filedialog.askopenfilename(
+            title="Select Excel File",
+            filetypes=self.EXCEL_FILETYPES,
+            initialdir=self.config.get('Paths', 'last_excel_dir', fallback='') or None
+        )
         
         if file_path:
             self.excel_path_var.set(file_path)
@@ -377,17 +474,33 @@ class EZCADAutomationApp:
             # Load and preview
             df = self.excel_handler.load_excel(file_path)
             if df is not None:
-                preview = self.excel_handler.get_preview()
-                
-                self.preview_text.config(state=tk.NORMAL)
-                self.preview_text.delete("1.0", tk.END)
-                self.preview_text.insert(tk.END, preview)
-                self.preview_text.config(state=tk.DISABLED)
+                self.cached_df = df
+                self._cached_df_key = (file_path, os.path.getmtime(file_path))
+                self._show_preview(df)
+    
+    def _show_preview(self, df, max_rows=100):
+        """Show the first rows of a DataFrame in the preview table"""
+        tree = self.preview_tree
+        tree.delete(*tree.get_children())
+        
+        # Positional column ids, since Excel headers may repeat or contain any text
+        column_ids = [f"c{index}" for index in range(len(df.columns))]
+        tree["columns"] = column_ids
+        for column_id, name in zip(column_ids, df.columns):
+            tree.heading(column_id, text=str(name))
+            tree.column(column_id, width=100, stretch=False)
+        
+        preview = df.head(max_rows).astype(object).fillna("")
+        for row in preview.itertuples(index=False, name=None):
+            tree.insert("", tk.END, values=row)
     
     def _select_ezd(self):
         """Browse for EZD file"""
-        file_types = [("EZD files", "*.ezd"), ("All files", "*.*")]
-        file_path = filedialog.askopenfilename(title="Select EZD Template File", filetypes=file_types)
+        file_path = filedialog.askopenfilename(
+            title="Select EZD Template File",
+            filetypes=self.EZD_FILETYPES,
+            initialdir=self.config.get('Paths', 'last_ezd_dir', fallback='') or None
+        )
         
         if file_path:
             self.ezd_path_var.set(file_path)
@@ -402,16 +515,25 @@ class EZCADAutomationApp:
     
     def _select_bridge_exe(self):
         """Browse for bridge executable"""
-        file_types = [("Executable files", "*.exe"), ("All files", "*.*")]
-        file_path = filedialog.askopenfilename(title="Select EZCADBridge Executable", filetypes=file_types)
+        file_path = filedialog.askopenfilename(
+            title="Select EZCADBridge Executable",
+            filetypes=self.EXE_FILETYPES,
+            initialdir=os.path.dirname(self.bridge_exe_var.get()) or None
+        )
         
         if file_path:
+            if self._processing:
+                messagebox.showwarning("Processing", "Please wait for processing to finish before changing the bridge executable.")
+                return
+            
             self.bridge_exe_var.set(file_path)
             self.config.set('Paths', 'ezcad_bridge_exe', file_path)
             self.config.save_config()
             self.logger.info(f"Selected bridge executable: {file_path}")
             
-            # Reinitialize integration with new bridge path
+            # Stop the old bridge process off the Tk thread (it waits for any listing
+            # in progress), then reinitialize integration with the new bridge path
+            threading.Thread(target=self.integration.close, daemon=True).start()
             self.integration = EZCADIntegration(self.config, self.logger)
     
     def _select_output_dir(self):
@@ -425,13 +547,20 @@ class EZCADAutomationApp:
             self.logger.info(f"Selected output directory: {dir_path}")
     
     def _test_bridge(self):
-        """Test the bridge connection"""
+        """Test the bridge connection once clicks have settled for 300 ms"""
+        if self._test_after_id is not None:
+            self.root.after_cancel(self._test_after_id)
+        self._test_after_id = self.root.after(300, self._do_test_bridge)
+    
+    def _do_test_bridge(self):
+        """Start the bridge test"""
+        self._test_after_id = None
         ezd_file = self.ezd_path_var.get()
         if not ezd_file:
             messagebox.showwarning("Missing File", "Please select an EZD template file first.")
             return
         
-        self.status_var.set("Testing bridge connection...")
+        self._set_status("Testing bridge connection...")
         
         # Run test in a separate thread
         threading.Thread(target=self._test_bridge_thread, args=(ezd_file,), daemon=True).start()
@@ -443,50 +572,84 @@ class EZCADAutomationApp:
             
             if result:
                 self.root.after(0, lambda: messagebox.showinfo("Bridge Test", "Bridge connection successful!"))
-                self.root.after(0, lambda: self.status_var.set("Bridge connection successful"))
+                self._set_status("Bridge connection successful")
             else:
                 self.root.after(0, lambda: messagebox.showerror("Bridge Test", "Failed to connect to bridge."))
-                self.root.after(0, lambda: self.status_var.set("Bridge connection failed"))
+                self._set_status("Bridge connection failed")
                 
         except Exception as e:
             error_msg = str(e)
             self.logger.error(f"Error in bridge test: {error_msg}")
             self.root.after(0, lambda msg=error_msg: messagebox.showerror("Bridge Error", f"Error: {msg}"))
-            self.root.after(0, lambda: self.status_var.set("Error"))
+            self._set_status("Error")
     
     def _list_entities(self):
-        """List entities in the current template"""
+        """List entities in the current template once requests have settled for 300 ms"""
+        if self._list_after_id is not None:
+            self.root.after_cancel(self._list_after_id)
+        self._list_after_id = self.root.after(300, self._do_list_entities)
+    
+    def _do_list_entities(self):
+        """Start listing the entities in the current template"""
+        self._list_after_id = None
         ezd_file = self.ezd_path_var.get()
         if not ezd_file:
             messagebox.showwarning("Missing File", "Please select an EZD template file first.")
             return
         
-        self.status_var.set("Listing template entities...")
+        self._set_status("Listing template entities...")
         
-        # Run in a separate thread
-        threading.Thread(target=self._list_entities_thread, args=(ezd_file,), daemon=True).start()
+        # Start from an empty widget; results of earlier listings are ignored from now on
+        self._entity_generation += 1
+        self._update_entities_text("")
+        
+        # Run in a separate thread; its text is drained into the widget on the GUI thread
+        threading.Thread(target=self._list_entities_thread,
+                         args=(ezd_file, self._entity_generation), daemon=True).start()
+        if not self._entity_draining:
+            self._entity_draining = True
+            self.root.after(50, self._drain_entity_queue)
     
-    def _list_entities_thread(self, ezd_file):
+    def _list_entities_thread(self, ezd_file, generation):
         """Thread function to list entities"""
         try:
             entities = self.integration.list_entities_in_template(ezd_file)
             
-            # Update entities display
-            entities_text = "Template entities:\n"
+            # Build the whole display text here so the GUI thread only inserts it
+            parts = ["Template entities:"]
             if entities:
-                for entity in entities:
-                    entities_text += f"  - {entity}\n"
+                parts.extend(f"  - {entity}" for entity in entities)
             else:
-                entities_text += "  No text entities found in template."
+                parts.append("  No text entities found in template.")
+            self._entity_queue.put((generation, "\n".join(parts)))
                 
-            self.root.after(0, lambda text=entities_text: self._update_entities_text(text))
-            self.root.after(0, lambda count=len(entities): self.status_var.set(f"Found {count} entities"))
+            self._set_status(f"Found {len(entities)} entities")
                 
         except Exception as e:
             error_msg = str(e)
             self.logger.error(f"Error listing entities: {error_msg}")
             self.root.after(0, lambda msg=error_msg: messagebox.showerror("Entity List Error", f"Error: {msg}"))
-            self.root.after(0, lambda: self.status_var.set("Error"))
+            self._set_status("Error")
+            
+        finally:
+            self._entity_queue.put((generation, None))
+    
+    def _drain_entity_queue(self):
+        """Show the entity text of the latest listing, polling until that listing is done"""
+        while True:
+            try:
+                generation, text = self._entity_queue.get_nowait()
+            except queue.Empty:
+                break
+            if generation != self._entity_generation:
+                # Left over from a listing that has been superseded
+                continue
+            if text is None:
+                self._entity_draining = False
+                return
+            self._update_entities_text(text)
+            
+        self.root.after(50, self._drain_entity_queue)
     
     def _update_entities_text(self, text):
         """Update the entities text widget"""
@@ -521,21 +684,30 @@ class EZCADAutomationApp:
                                      "Auto-save is enabled but output directory is not set or doesn't exist.")
                 return
         
-        self.status_var.set("Processing Excel file...")
+        # Reuse the previewed DataFrame unless the file has changed since
+        df = None
+        try:
+            if self._cached_df_key == (excel_file, os.path.getmtime(excel_file)):
+                df = self.cached_df
+        except OSError:
+            pass
+        
+        self._set_status("Processing Excel file...")
+        self._processing = True
         
         # Run processing in a separate thread
         threading.Thread(target=self._process_excel_thread, 
-                       args=(excel_file, ezd_file, output_path), 
+                       args=(excel_file, ezd_file, output_path, df), 
                        daemon=True).start()
     
-    def _process_excel_thread(self, excel_file, ezd_file, output_path):
+    def _process_excel_thread(self, excel_file, ezd_file, output_path, df=None):
         """Thread function to process Excel"""
         try:
             # Apply current settings
             self.config.set('Settings', 'update_excel_status', str(self.update_excel_status_var.get()))
             
             # Process the file
-            result = self.integration.process_excel_file(excel_file, ezd_file, output_path)
+            result = self.integration.process_excel_file(excel_file, ezd_file, output_path, df=df)
             
             # Show results
             if result.get('success', False):
@@ -543,29 +715,35 @@ class EZCADAutomationApp:
                 total_count = result.get('total', 0)
                 duration = result.get('duration', 0)
                 
-                message = f"Processing complete!\n\n"
-                message += f"Successfully processed: {success_count}/{total_count} items\n"
-                message += f"Duration: {duration:.2f} seconds"
+                lines = [
+                    "Processing complete!",
+                    "",
+                    f"Successfully processed: {success_count}/{total_count} items",
+                    f"Duration: {duration:.2f} seconds",
+                ]
                 
                 if output_path and os.path.exists(output_path):
-                    message += f"\n\nOutput saved to: {output_path}"
+                    lines += ["", f"Output saved to: {output_path}"]
+                    
+                message = "\n".join(lines)
                 
                 # Pass the message as a parameter to the lambda
                 self.root.after(0, lambda msg=message: messagebox.showinfo("Processing Complete", msg))
                 
-                # Pass the counts as parameters to the lambda
                 status_msg = f"Processed {success_count}/{total_count} items"
-                self.root.after(0, lambda msg=status_msg: self.status_var.set(msg))
+                self._set_status(status_msg)
             else:
                 error_msg = result.get('error', 'Unknown error')
                 self.root.after(0, lambda msg=error_msg: messagebox.showerror("Processing Error", f"Error: {msg}"))
-                self.root.after(0, lambda: self.status_var.set("Processing failed"))
+                self._set_status("Processing failed")
                 
         except Exception as e:
             error_msg = str(e)
             self.logger.error(f"Error processing Excel: {error_msg}")
             self.root.after(0, lambda msg=error_msg: messagebox.showerror("Processing Error", f"Error: {msg}"))
-            self.root.after(0, lambda: self.status_var.set("Error"))
+            self._set_status("Error")
+        finally:
+            self._processing = False
     
     def _save_profile(self):
         """Save current settings as a profile"""
@@ -580,6 +758,7 @@ class EZCADAutomationApp:
             
             # Save profile
             profile_file = self.config.save_profile(profile_name)
+            self._profiles_cache = None
             self.logger.info(f"Saved profile: {profile_name} to {profile_file}")
             messagebox.showinfo("Profile Saved", f"Profile '{profile_name}' has been saved.")
             
@@ -589,7 +768,9 @@ class EZCADAutomationApp:
     
     def _show_load_profile(self):
         """Show dialog to select a profile to load"""
-        profiles = self.config.list_profiles()
+        if self._profiles_cache is None:
+            self._profiles_cache = self.config.list_profiles()
+        profiles = self._profiles_cache
         
         if not profiles:
             messagebox.showinfo("No Profiles", "No saved profiles found.")
@@ -615,9 +796,8 @@ class EZCADAutomationApp:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         listbox.config(yscrollcommand=scrollbar.set)
         
-        # Populate listbox
-        for profile in profiles:
-            listbox.insert(tk.END, profile)
+        # Populate listbox in a single call
+        listbox.insert(tk.END, *profiles)
         
         # Buttons
         button_frame = ttk.Frame(dialog)
@@ -655,22 +835,31 @@ class EZCADAutomationApp:
     
     def _open_log_directory(self):
         """Open the log directory in file explorer"""
-        log_dir = os.path.abspath("logs")
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-            
-        # Open file explorer to log directory
-        if sys.platform == 'win32':
-            os.startfile(log_dir)
-        else:
-            import subprocess
-            subprocess.Popen(['xdg-open', log_dir])
+        # Starting the file explorer can take a while, so keep it off the GUI thread
+        threading.Thread(target=self._open_log_directory_thread, args=(self.log_dir,), daemon=True).start()
+    
+    def _open_log_directory_thread(self, log_dir):
+        """Thread function to open the log directory"""
+        try:
+            if sys.platform == 'win32':
+                os.startfile(log_dir)
+            else:
+                import subprocess
+                subprocess.Popen(['xdg-open', log_dir])
+        except Exception as e:
+            self.logger.error(f"Error opening log directory: {str(e)}")
     
     def on_closing(self):
         """Handle window closing"""
+        # Stopping the bridge mid-batch would leave rows marked as processed that never were
+        if self._processing:
+            messagebox.showwarning("Processing", "Please wait for processing to finish before closing.")
+            return
+        
         # Cleanup
         if hasattr(self, 'log_panel'):
             self.log_panel.stop()
+        self.integration.close()
         
         # Close the window
         self.root.destroy()
@@ -678,6 +867,13 @@ class EZCADAutomationApp:
 
 def main():
     """Main entry point for the application"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="EZCAD2 Automation")
+    parser.add_argument("--no_cache", action="store_true",
+                        help="Always re-parse Excel files instead of using the .cache/excel copies")
+    args = parser.parse_args()
+    
     # Set up exception logging
     setup_exception_logging()
     
@@ -695,7 +891,7 @@ def main():
         pass  # No icon available, continue without
     
     # Create the application
-    app = EZCADAutomationApp(root)
+    app = EZCADAutomationApp(root, use_cache=not args.no_cache)
     
     # Set up the window close handler
     root.protocol("WM_DELETE_WINDOW", app.on_closing)